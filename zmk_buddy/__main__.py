@@ -7,13 +7,8 @@ import logging
 import sys
 from argparse import ArgumentParser, FileType, Namespace
 
-import yaml
-
-from keymap_drawer.config import Config
-
 from zmk_buddy import logger
 from zmk_buddy.live_preflight import has_gtk
-from zmk_buddy.zmk_client import ScannerAPI, SimScanner, ZMKScanner
 
 
 def main() -> None:
@@ -60,11 +55,17 @@ def main() -> None:
         print("  pip install zmk-buddy", file=sys.stderr)
         sys.exit(1)
 
-    # Import and run live view
+    # Heavy imports are deferred until after argument parsing so --help and usage errors stay fast
+    import yaml
+    from keymap_drawer.config import Config
+
     from zmk_buddy.live_gtk import live
+    from zmk_buddy.util import YAML_LOADER
+    from zmk_buddy.zmk_client import ScannerAPI, SimScanner, ZMKScanner
 
     # Load config from file if specified, otherwise use defaults
-    config = Config.model_validate(yaml.safe_load(args.config)) if args.config else Config()
+    logger.debug(f"Using YAML loader: {YAML_LOADER.__name__}")
+    config = Config.model_validate(yaml.load(args.config.read(), Loader=YAML_LOADER)) if args.config else Config()
 
     # Create scanner - use SimScanner in testing mode, ZMKScanner otherwise
     testing_mode = args.testing
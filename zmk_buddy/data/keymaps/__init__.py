@@ -1,8 +1,11 @@
 """Keymap data and utilities for zmk-buddy."""
 
-import yaml
 from importlib.resources import files
 
+import yaml
+
+from zmk_buddy.util import YAML_LOADER
+
 
 def load_default_keymap() -> dict[str, object]:
     """Load the default miryoku keymap from package resources.
@@ -10,5 +13,5 @@ def load_default_keymap() -> dict[str, object]:
     Returns:
         dict: Parsed YAML keymap data
     """
-    keymap_text = files("zmk_buddy.data.keymaps").joinpath("miryoku.yaml").read_text(encoding="utf-8")
-    return yaml.safe_load(keymap_text)  # type: ignore[no-any-return]
+    keymap_bytes = files("zmk_buddy.data.keymaps").joinpath("miryoku.yaml").read_bytes()
+    return yaml.load(keymap_bytes, Loader=YAML_LOADER)  # type: ignore[no-any-return]
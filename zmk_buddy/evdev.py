@@ -7,11 +7,10 @@ which directly accesses Linux input devices for reliable key event capture.
 
 import logging
 import select
-import time
-from threading import Thread
+from threading import Event, Thread
 from typing import override
 
-from zmk_buddy.keyboard_monitor_base import KeyboardMonitorBase
+from zmk_buddy.keyboard_monitor_base import KeyBatch, KeyboardMonitorBase
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +18,23 @@ logger = logging.getLogger(__name__)
 evdev_available = False
 try:
     import evdev
-    from evdev import InputDevice, categorize, ecodes
+    from evdev import InputDevice, ecodes
+
+    # Bind constants once so device probing is plain int membership
+    _EV_KEY: int = ecodes.EV_KEY
+    _KEYBOARD_PROBE: frozenset[int] = frozenset((ecodes.KEY_A, ecodes.KEY_B, ecodes.KEY_C))
 
     evdev_available = True
 except ImportError:
     pass
 
+# How often the event loop wakes up to check for a stop request
+POLL_TIMEOUT_SECS = 1.0
+
+# Raw EV_KEY event values (see KeyEvent.key_up/key_down/key_hold)
+KEY_STATE_UP = 0
+KEY_STATE_DOWN = 1
+
 # Map evdev key names to SVG labels
 EVDEV_KEY_MAP = {
     "leftshift": "Shift",
@@ -46,6 +56,36 @@ EVDEV_KEY_MAP = {
 }
 
 
+def _build_ecode_to_label() -> dict[int, str]:
+    """Precompute a table from evdev key code to SVG label.
+
+    Only single-character keys and keys in EVDEV_KEY_MAP are included, so the
+    event loop can drop any other key with a single dict lookup.
+    """
+    table: dict[int, str] = {}
+    if not evdev_available:
+        return table
+
+    for code, keycode in ecodes.KEY.items():
+        # Some codes have several aliases, use the first like categorize() does
+        if isinstance(keycode, (list, tuple)):
+            keycode = keycode[0]
+
+        if not keycode.startswith("KEY_"):
+            continue
+
+        key_name = keycode[4:].lower()
+        key_char = EVDEV_KEY_MAP.get(key_name, key_name)
+        if len(key_char) == 1 or key_name in EVDEV_KEY_MAP:
+            table[code] = key_char
+
+    return table
+
+
+# Map evdev key codes directly to SVG labels
+ECODE_TO_LABEL: dict[int, str] = _build_ecode_to_label()
+
+
 class EvdevKeyboardMonitor(KeyboardMonitorBase):
     """Monitor keyboard events using evdev (Linux only).
 
@@ -55,7 +95,7 @@ class EvdevKeyboardMonitor(KeyboardMonitorBase):
 
     def __init__(self) -> None:
         super().__init__()
-        self.stop_flag: bool = False
+        self._stop_event = Event()
         self.my_thread: Thread | None = None
 
     def _find_keyboard_devices_evdev(self) -> list[InputDevice[str]]:
@@ -69,9 +109,7 @@ class EvdevKeyboardMonitor(KeyboardMonitorBase):
             for device in devices:
                 # Look for a device with keyboard capabilities
                 caps = device.capabilities()
-                if ecodes.EV_KEY in caps and any(
-                    key in caps[ecodes.EV_KEY] for key in [ecodes.KEY_A, ecodes.KEY_B, ecodes.KEY_C]
-                ):
+                if _EV_KEY in caps and not _KEYBOARD_PROBE.isdisjoint(caps[_EV_KEY]):
                     keyboards.append(device)
         except (PermissionError, OSError) as e:
             logger.error(f"Cannot access input devices: {e}")
@@ -80,6 +118,65 @@ class EvdevKeyboardMonitor(KeyboardMonitorBase):
 
         return keyboards
 
+    def _run_devices(self, devices: list[InputDevice[str]], ep: select.epoll) -> None:
+        """Read key events from the devices until a stop is requested.
+
+        Args:
+            devices: The keyboard devices to read from
+            ep: epoll object to register the devices with
+        """
+        # Create a table from file descriptor to device, indexed directly by fd
+        # (fds are small ints, so this is a plain list index rather than a hash lookup)
+        fd_to_device: list[InputDevice[str] | None] = [None] * (max(dev.fd for dev in devices) + 1)
+        for dev in devices:
+            fd_to_device[dev.fd] = dev
+
+        # Level-triggered, so each wakeup's device.read() drains what is pending
+        for dev in devices:
+            ep.register(dev.fd, select.EPOLLIN)
+
+        # Bind hot lookups to locals once, outside the wakeup loop
+        poll = ep.poll
+        ev_key = _EV_KEY
+        label_for_code = ECODE_TO_LABEL.get
+        emit_batch = self.emit_keys_batched
+
+        # Collect all events from a wakeup so they cross to the main loop in one hop
+        # (emit_keys_batched copies the events, so the list is reused)
+        batch: KeyBatch = []
+        append = batch.append
+
+        while not self._stop_event.is_set():
+            # Wait for events from any device
+            ready = poll(POLL_TIMEOUT_SECS)
+
+            for fd, _ in ready:
+                device = fd_to_device[fd]
+                if device is None:
+                    # Not one of ours, epoll only reports registered fds so this shouldn't happen
+                    continue
+                try:
+                    # Read events from this device
+                    for event in device.read():
+                        if event.type == ev_key:
+                            # Only handle single characters or mapped special keys
+                            key_char = label_for_code(event.code)
+                            if key_char is None:
+                                continue
+
+                            # Use the raw value rather than categorize(), auto-repeat is ignored
+                            if event.value == KEY_STATE_DOWN:
+                                append((key_char, True))
+                            elif event.value == KEY_STATE_UP:
+                                append((key_char, False))
+                except (OSError, IOError) as e:
+                    logger.warning(f"Error reading from {device.name}: {e}")
+                    raise
+
+            if batch:
+                emit_batch(batch)
+                batch.clear()
+
     @override
     def start(self) -> bool:
         """Start monitoring keyboard events using evdev"""
@@ -88,7 +185,7 @@ class EvdevKeyboardMonitor(KeyboardMonitorBase):
 
         def event_loop():
             """Background thread that monitors keyboard events with auto-reconnect"""
-            while not self.stop_flag:
+            while not self._stop_event.is_set():
                 # Try to find all keyboard devices
                 devices = self._find_keyboard_devices_evdev()
 
@@ -97,48 +194,16 @@ class EvdevKeyboardMonitor(KeyboardMonitorBase):
                     logger.warning(
                         "No keyboard device found, retrying in 10 seconds (Ensure user has access to /dev/input/event*: sudo usermod -aG input $USER)..."
                     )
-                    time.sleep(10)
+                    if self._stop_event.wait(10):
+                        break
                     continue
 
                 logger.info(f"Monitoring {len(devices)} keyboard(s): {', '.join(d.name for d in devices)}")
 
                 try:
-                    # Create a mapping from file descriptor to device
-                    fd_to_device = {dev.fd: dev for dev in devices}
-
-                    while not self.stop_flag:
-                        # Use select to wait for events from any device
-                        r, _, _ = select.select(fd_to_device.keys(), [], [], 1.0)
-
-                        for fd in r:
-                            device = fd_to_device[fd]
-                            try:
-                                # Read events from this device
-                                for event in device.read():
-                                    if event.type == ecodes.EV_KEY:
-                                        key_event = categorize(event)
-
-                                        # Map keycode to character
-                                        keycode = key_event.keycode
-                                        if isinstance(keycode, list):
-                                            keycode = keycode[0]
-
-                                        # Strip KEY_ prefix and convert to lowercase
-                                        if keycode.startswith("KEY_"):
-                                            key_name = keycode[4:].lower()
-
-                                            # Check if it's a special key that needs mapping
-                                            key_char = EVDEV_KEY_MAP.get(key_name, key_name)
-
-                                            # Only handle single characters or mapped special keys
-                                            if len(key_char) == 1 or key_name in EVDEV_KEY_MAP:
-                                                if key_event.keystate == key_event.key_down:
-                                                    self.emit_key_pressed(key_char)
-                                                elif key_event.keystate == key_event.key_up:
-                                                    self.emit_key_released(key_char)
-                            except (OSError, IOError) as e:
-                                logger.warning(f"Error reading from {device.name}: {e}")
-                                raise
+                    # Register all devices with epoll once, rather than rebuilding an fd set per wakeup
+                    with select.epoll() as ep:
+                        self._run_devices(devices, ep)
                 except Exception as e:
                     logger.warning(f"Keyboard(s) disconnected: {e}")
                 finally:
@@ -148,9 +213,10 @@ class EvdevKeyboardMonitor(KeyboardMonitorBase):
                         except Exception:
                             pass
 
-                if not self.stop_flag:
+                if not self._stop_event.is_set():
                     logger.info("Attempting to reconnect in 10 seconds...")
-                    time.sleep(10)
+                    if self._stop_event.wait(10):
+                        break
 
         self.my_thread = Thread(target=event_loop, daemon=True)
         self.my_thread.start()
@@ -159,7 +225,8 @@ class EvdevKeyboardMonitor(KeyboardMonitorBase):
     @override
     def stop(self):
         """Stop monitoring keyboard events"""
-        self.stop_flag = True
+        # Wakes the event loop immediately if it is waiting to reconnect
+        self._stop_event.set()
 
         if self.my_thread:
             self.my_thread.join(timeout=1.0)
@@ -8,6 +8,8 @@ Uses GObject for signal-based communication.
 # pylint: disable=wrong-import-position
 
 import logging
+from collections import deque
+from threading import Lock
 from typing import Callable
 
 import gi
@@ -20,6 +22,9 @@ logger = logging.getLogger(__name__)
 # Type alias for keyboard event callbacks
 KeyCallback = Callable[[str], None]
 
+# A batch of (key, is_press) events delivered in a single main-loop hop
+KeyBatch = list[tuple[str, bool]]
+
 
 class KeyboardMonitorBase(GObject.Object):
     """Base class for keyboard monitoring implementations.
@@ -31,8 +36,16 @@ class KeyboardMonitorBase(GObject.Object):
     __gsignals__ = {
         "key-pressed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
         "key-released": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+        "keys-batched": (GObject.SignalFlags.RUN_FIRST, None, (object,)),
     }
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Events queued by the monitor thread, drained by a single idle callback per burst
+        self._queue: deque[tuple[str, bool]] = deque()
+        self._lock = Lock()
+        self._idle_pending = False
+
     def start(self) -> bool:
         """
         Start monitoring keyboard events.
@@ -48,8 +61,50 @@ class KeyboardMonitorBase(GObject.Object):
 
     def emit_key_pressed(self, key: str) -> None:
         """Emit a key-pressed signal (thread-safe via GLib.idle_add)."""
-        GLib.idle_add(self.emit, "key-pressed", key)
+        self.emit_keys_batched([(key, True)])
 
     def emit_key_released(self, key: str) -> None:
         """Emit a key-released signal (thread-safe via GLib.idle_add)."""
-        GLib.idle_add(self.emit, "key-released", key)
+        self.emit_keys_batched([(key, False)])
+
+    def emit_keys_batched(self, batch: KeyBatch) -> None:
+        """Queue a batch of key events for the main loop (thread-safe via GLib.idle_add).
+
+        Only one idle callback is scheduled until the queue is drained, so a burst
+        of events costs a single main-loop turn.
+        """
+        with self._lock:
+            self._queue.extend(batch)
+            if self._idle_pending:
+                return
+            self._idle_pending = True
+        GLib.idle_add(self._dispatch_batch)
+
+    def _dispatch_batch(self) -> bool:
+        """Deliver all queued events on the main loop.
+
+        The per-key signals are re-emitted from the batch for listeners that
+        don't handle keys-batched, but only if any are connected.
+        """
+        with self._lock:
+            batch = list(self._queue)
+            self._queue.clear()
+            self._idle_pending = False
+
+        self.emit("keys-batched", batch)
+
+        pressed_pending = GObject.signal_has_handler_pending(self, _KEY_PRESSED_SIGNAL_ID, 0, False)
+        released_pending = GObject.signal_has_handler_pending(self, _KEY_RELEASED_SIGNAL_ID, 0, False)
+        if pressed_pending or released_pending:
+            for key, is_press in batch:
+                if is_press:
+                    if pressed_pending:
+                        self.emit("key-pressed", key)
+                elif released_pending:
+                    self.emit("key-released", key)
+        return False  # Don't repeat
+
+
+# Signal ids for the per-key compatibility signals, looked up once
+_KEY_PRESSED_SIGNAL_ID = GObject.signal_lookup("key-pressed", KeyboardMonitorBase)
+_KEY_RELEASED_SIGNAL_ID = GObject.signal_lookup("key-released", KeyboardMonitorBase)
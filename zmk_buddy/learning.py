@@ -7,6 +7,7 @@ before typing the next key.
 
 import json
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,15 @@ from zmk_buddy.util import get_settings_dir
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson for faster stats serialization, falling back to the stdlib json module
+orjson_available = False
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    pass
+
 # Score threshold (0-100) above which a key is considered "learned"
 LEARNED_SCORE_THRESHOLD = 80
 
@@ -33,8 +43,11 @@ MIN_SCORE = 0
 # Filename for storing key statistics
 STATS_FILENAME = "key_stats.json"
 
+# Keys that invalidate the previously typed key
+BACKSPACE_KEYS = frozenset(("backspace", "bckspc", "delete"))
+
 
-@dataclass
+@dataclass(slots=True)
 class KeyStats:
     """Statistics for a single key using a score-based system.
 
@@ -44,7 +57,7 @@ class KeyStats:
     - Key is "learned" when score > 80%
     """
 
-    score: float = 0.0
+    score: int = 0
     total_presses: int = 0
 
     def record_correct(self) -> None:
@@ -64,14 +77,15 @@ class KeyStats:
         """
         return self.score > LEARNED_SCORE_THRESHOLD
 
-    def to_dict(self) -> dict[str, float | int]:
+    def to_dict(self) -> dict[str, int]:
         """Convert to dictionary for JSON serialization."""
         return {"score": self.score, "total_presses": self.total_presses}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "KeyStats":
         """Create from dictionary (JSON deserialization)."""
-        return cls(score=data.get("score", 0.0), total_presses=data.get("total_presses", 0))
+        # Older stats files stored the score as a float
+        return cls(score=int(data.get("score", 0)), total_presses=data.get("total_presses", 0))
 
 
 class LearningTracker:
@@ -87,6 +101,13 @@ class LearningTracker:
         self._pending_key: str | None = None  # Last key pressed, awaiting validation
         self._stats_file = get_settings_dir() / STATS_FILENAME
         self._testing_mode = testing_mode
+        self._dirty: set[str] = set()  # Keys changed since the last save
+
+        # Running aggregates so summaries don't rescan every key
+        # Replaced rather than mutated, so a handed-out set never changes underneath its holder
+        self._learned_cache: frozenset[str] | None = None
+        self._score_sum: int = 0
+        self._presses_sum: int = 0
 
         if not testing_mode:
             self._load_stats()
@@ -100,8 +121,11 @@ class LearningTracker:
             return
 
         try:
-            with open(self._stats_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if orjson_available:
+                data = orjson.loads(self._stats_file.read_bytes())
+            else:
+                with open(self._stats_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
 
             self._stats = {key: KeyStats.from_dict(value) for key, value in data.items()}
             logger.info(f"Loaded key statistics for {len(self._stats)} keys")
@@ -109,32 +133,90 @@ class LearningTracker:
             logger.warning(f"Failed to load stats file: {e}")
             self._stats = {}
 
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        """Recompute running sums from scratch and drop the learned-set cache."""
+        self._learned_cache = None
+        self._score_sum = sum(s.score for s in self._stats.values())
+        self._presses_sum = sum(s.total_presses for s in self._stats.values())
+
     def save_stats(self) -> Path | None:
         """Save statistics to JSON file."""
         if self._testing_mode:
             logger.info("Testing mode: skipping save of key statistics")
             return None
 
+        if not self._dirty and self._stats_file.exists():
+            logger.debug("Key statistics unchanged, skipping save")
+            return self._stats_file
+
+        # Serialize _stats directly rather than building an intermediate dict of dicts.
+        # orjson encodes the KeyStats dataclass natively; json uses to_dict() as its fallback.
+        if orjson_available:
+            payload = orjson.dumps(self._stats, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self._stats, indent=2, default=KeyStats.to_dict).encode("utf-8")
+
+        # Write to a temp file in the same directory, fsync it, then rename it into place,
+        # so an interrupted save never leaves a truncated stats file behind
+        tmp_file = self._stats_file.with_name(self._stats_file.name + ".tmp")
         try:
-            data = {key: stats.to_dict() for key, stats in self._stats.items()}
-            with open(self._stats_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self._stats_file)
+            self._dirty.clear()
             logger.debug(f"Saved key statistics to {self._stats_file}")
             return self._stats_file
         except OSError as e:
             logger.warning(f"Failed to save stats file: {e}")
             return None
+        finally:
+            # Only present if the save failed or was interrupted (e.g. ctrl-C) before the rename
+            tmp_file.unlink(missing_ok=True)
 
     def _get_stats(self, key: str) -> KeyStats:
         """Get or create statistics for a key."""
-        if key not in self._stats:
+        stats = self._stats.get(key)
+        if stats is None:
             if self._testing_mode:
                 # In testing mode, initialize keys at 80% (at learned threshold)
                 # One correct keystroke will push them to 81% (>80% = learned)
-                self._stats[key] = KeyStats(score=80, total_presses=0)
+                stats = KeyStats(score=80, total_presses=0)
             else:
-                self._stats[key] = KeyStats()
-        return self._stats[key]
+                stats = KeyStats()
+            self._stats[key] = stats
+            self._score_sum += stats.score
+            if self._learned_cache is not None and stats.is_learned():
+                self._learned_cache = self._learned_cache | {key}
+        return stats
+
+    def _record(self, key: str, correct: bool) -> KeyStats:
+        """Record a keystroke for a key, keeping the running aggregates in sync."""
+        stats = self._get_stats(key)
+        old_score = stats.score
+        was_learned = stats.is_learned()
+
+        if correct:
+            stats.record_correct()
+        else:
+            stats.record_incorrect()
+
+        self._score_sum += stats.score - old_score
+        self._presses_sum += 1
+        self._dirty.add(key)
+
+        # Only touch the learned set when the key crosses the threshold
+        if self._learned_cache is not None:
+            is_learned = stats.is_learned()
+            if is_learned and not was_learned:
+                self._learned_cache = self._learned_cache | {key}
+            elif was_learned and not is_learned:
+                self._learned_cache = self._learned_cache - {key}
+
+        return stats
 
     def on_key_press(self, key: str) -> None:
         """Handle a key press event.
@@ -149,12 +231,11 @@ class LearningTracker:
         key_lower = key.lower()
 
         # Handle backspace specially - it invalidates the previous key
-        if key_lower in ("backspace", "bckspc", "delete"):
+        if key_lower in BACKSPACE_KEYS:
             if self._pending_key is not None:
                 # Previous key was incorrect (user pressed backspace to correct it)
-                stats = self._get_stats(self._pending_key)
-                stats.record_incorrect()
-                logger.debug(f"Key '{self._pending_key}' marked incorrect (score: {stats.score:.1f}%)")
+                stats = self._record(self._pending_key, correct=False)
+                logger.debug(f"Key '{self._pending_key}' marked incorrect (score: {stats.score}%)")
                 self._pending_key = None
             # Don't track backspace itself as a learning key
             return
@@ -162,9 +243,8 @@ class LearningTracker:
         # Check if previous key should be marked as correct
         if self._pending_key is not None:
             # Previous key was correct (no backspace before this key)
-            stats = self._get_stats(self._pending_key)
-            stats.record_correct()
-            logger.debug(f"Key '{self._pending_key}' marked correct (score: {stats.score:.1f}%)")
+            stats = self._record(self._pending_key, correct=True)
+            logger.debug(f"Key '{self._pending_key}' marked correct (score: {stats.score}%)")
 
         # Set this key as pending (will be validated on next keypress)
         self._pending_key = key_lower
@@ -184,20 +264,23 @@ class LearningTracker:
         Returns:
             True if the key meets the learning thresholds
         """
-        key_lower = key.lower()
-        if key_lower not in self._stats:
-            return False
-        return self._stats[key_lower].is_learned()
+        stats = self._stats.get(key.lower())
+        return stats is not None and stats.is_learned()
 
-    def get_learned_keys(self) -> set[str]:
+    def get_learned_keys(self) -> frozenset[str]:
         """Get the set of all learned keys.
 
+        The same object is returned until a key crosses the learned threshold,
+        so callers can detect changes with an identity check.
+
         Returns:
             Set of key labels that are considered learned
         """
-        return {key for key, stats in self._stats.items() if stats.is_learned()}
+        if self._learned_cache is None:
+            self._learned_cache = frozenset(key for key, stats in self._stats.items() if stats.is_learned())
+        return self._learned_cache
 
-    def get_key_score(self, key: str) -> float | None:
+    def get_key_score(self, key: str) -> int | None:
         """Get the score for a specific key.
 
         Args:
@@ -206,10 +289,8 @@ class LearningTracker:
         Returns:
             Score percentage (0-100) or None if no data
         """
-        key_lower = key.lower()
-        if key_lower not in self._stats:
-            return None
-        return self._stats[key_lower].score
+        stats = self._stats.get(key.lower())
+        return None if stats is None else stats.score
 
     def get_summary(self) -> str:
         """Get a human-readable summary of learning progress.
@@ -224,12 +305,8 @@ class LearningTracker:
         learned_keys = len(self.get_learned_keys())
 
         # Calculate average score across all keys
-        if total_keys > 0:
-            avg_score = sum(s.score for s in self._stats.values()) / total_keys
-        else:
-            avg_score = 0.0
-
-        total_presses = sum(s.total_presses for s in self._stats.values())
+        avg_score = self._score_sum / total_keys
+        total_presses = self._presses_sum
 
         return (
             f"Learned {learned_keys}/{total_keys} keys | "
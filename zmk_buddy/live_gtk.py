@@ -7,20 +7,24 @@ and tracking keypresses in real-time using WebKit for high-quality SVG rendering
 # pylint: disable=wrong-import-position
 
 import asyncio
+import copy
+import gc
+import itertools
+import json
 import logging
 import platform
 import sys
 from argparse import Namespace
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
 from threading import Thread
-from typing import TYPE_CHECKING
-import xml.etree.ElementTree as ET
-
-import yaml
+from typing import TYPE_CHECKING, Any, Callable
 
 import gi
+import yaml
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("WebKit", "6.0")
@@ -31,13 +35,38 @@ from keymap_drawer.config import Config  # noqa: E402
 from keymap_drawer.draw import KeymapDrawer  # noqa: E402
 
 from zmk_buddy.learning import LearningTracker  # noqa: E402
-from zmk_buddy.keyboard_monitor_base import KeyboardMonitorBase  # noqa: E402
+from zmk_buddy.util import YAML_LOADER  # noqa: E402
+from zmk_buddy.keyboard_monitor_base import KeyBatch, KeyboardMonitorBase  # noqa: E402
 
 if TYPE_CHECKING:
     from zmk_buddy.zmk_client import ScannerAPI, ZMKStatusAdvertisement
 
 logger = logging.getLogger(__name__)
 
+# Namespace-qualified SVG tags, built once instead of at every iter()/findall() call
+_SVG_NS = "http://www.w3.org/2000/svg"
+_SVG_G = f"{{{_SVG_NS}}}g"
+_SVG_TEXT = f"{{{_SVG_NS}}}text"
+_SVG_RECT = f"{{{_SVG_NS}}}rect"
+
+# Prefer lxml (C tree walks and native parent pointers), fall back to the stdlib ElementTree
+lxml_available = False
+if TYPE_CHECKING:
+    # Type check against the stdlib API, lxml's tree API is a superset of it (lxml.etree.Element isn't a type)
+    import xml.etree.ElementTree as ET
+else:
+    try:
+        from lxml import etree as ET
+
+        lxml_available = True
+    except ImportError:
+        import xml.etree.ElementTree as ET
+
+        # Serialize SVG elements without ns0:/ns1: prefixes (registered once, this is global state).
+        # lxml keeps the prefixes from the parsed document so doesn't need this.
+        ET.register_namespace("", _SVG_NS)
+        ET.register_namespace("xlink", "http://www.w3.org/1999/xlink")
+
 
 def create_keyboard_monitor() -> KeyboardMonitorBase | None:
     """
@@ -85,6 +114,52 @@ SVG_SCALE = 0.75
 # Opacity for learned keys (0.0 = invisible, 1.0 = fully visible)
 LEARNED_KEY_OPACITY = 0.20
 
+# Minimum time between WebView reloads (about one frame at 60 Hz)
+UPDATE_MIN_INTERVAL_MS = 16
+
+# Directory and number of debug SVG snapshots to keep
+SVG_LOG_DIR = Path("/tmp/buddy_svg")
+SVG_LOG_KEEP = 4
+
+# Debug snapshot names: start time of this run plus a sequence number, so names sort in write order
+_SVG_LOG_RUN = datetime.now().strftime("%Y%m%d_%H%M%S")
+_svg_log_counter = itertools.count()
+
+# Static parts of the page wrapped around the SVG, built and UTF-8 encoded once rather than per reload.
+# TRANSPARENCY sets the SVG background opacity.
+HTML_HEAD_BYTES = (
+    f"""<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        html, body {{
+            margin: 0;
+            padding: 0;
+            background: transparent;
+            overflow: hidden;
+        }}
+        svg {{
+            max-width: 100%;
+            max-height: 100vh;
+            display: block;
+            margin: auto;
+            background-color: rgba(128, 128, 128, {TRANSPARENCY});
+            border-radius: 8px;
+        }}
+        /* Style for held keys */
+        rect.held {{
+            fill: #ffcc00 !important;
+            stroke: #ff9900 !important;
+        }}
+    </style>
+</head>
+<body>
+"""
+).encode("utf-8")
+HTML_TAIL_BYTES = b"""
+</body>
+</html>"""
+
 
 class KeymapWindow(Gtk.ApplicationWindow):
     """Main window for displaying the keymap SVG using WebKit."""
@@ -121,8 +196,26 @@ class KeymapWindow(Gtk.ApplicationWindow):
         # SVG state tracking
         self.svg_content = ""
         self.svg_root: ET.Element | None = None
+        self._parent_map: dict[ET.Element, ET.Element] = {}
+        self._key_rect_index: dict[str, list[ET.Element]] = {}
+        self._key_group_index: dict[str, list[ET.Element]] = {}
+        self._rect_ids: dict[ET.Element, str] = {}
+        self._rect_classes: dict[ET.Element, tuple[str, str]] = {}  # (normal, held) class strings
+        self._unmapped_keys: set[str] = set()  # Keys already logged as missing from the index
+        self._dimmed_keys: frozenset[str] = frozenset()  # Learned keys currently dimmed in svg_root
+        # Both sets hold lowercased key labels
         self.held_keys: set[str] = set()
-        self.learned_keys: set[str] = set()
+        self.learned_keys: frozenset[str] = frozenset()
+
+        # Drawer shared by all layer renders, created on first use
+        self._drawer: KeymapDrawer | None = None
+
+        # Rendered SVG and pristine parsed tree per layer, so revisiting a layer skips render + parse
+        self._layer_cache: dict[int, tuple[str, ET.Element]] = {}
+
+        # Last serialized SVG per layer with the learned set it was dimmed for. Held classes may be
+        # stale, but _on_load_changed resyncs those after every load.
+        self._serialized_cache: dict[int, tuple[frozenset[str], bytes, GLib.Bytes]] = {}
 
         # Keyboard monitor
         self.keyboard_monitor: KeyboardMonitorBase | None = None
@@ -130,6 +223,21 @@ class KeymapWindow(Gtk.ApplicationWindow):
         # Hide timer
         self.hide_timer_id: int | None = None
 
+        # Pending coalesced WebView reload, and when the last one ran (GLib monotonic microseconds)
+        self.update_source_id: int | None = None
+        self._last_update_us = 0
+
+        # Pending held-state changes (rect id -> held), flushed to the page in one script
+        self._pending_held: dict[str, bool] = {}
+        self.held_source_id: int | None = None
+
+        # Single worker thread for SVG tree mutation, serialization and debug snapshots, keeping them off
+        # the UI thread. Once a tree is shown only the worker touches it, and tasks run in submission order.
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zmk-buddy-svg")
+        self._closing = False  # Set when the window closes and the worker shuts down, see _submit
+        self._render_generation = 0  # Bumped per reload so stale serializations are dropped
+        self._svg_log_paths: deque[Path] | None = None  # Debug snapshots, oldest first
+
         # Setup window properties for transparency and always-on-top
         self._setup_window_properties()
 
@@ -144,6 +252,9 @@ class KeymapWindow(Gtk.ApplicationWindow):
         # Set content
         self.set_child(self.webview)
 
+        # Held-key changes are applied to the live DOM, so resync them whenever a full reload lands
+        self.webview.connect("load-changed", self._on_load_changed)
+
         # Generate and display initial SVG
         self._refresh_layer_display()
 
@@ -183,14 +294,15 @@ class KeymapWindow(Gtk.ApplicationWindow):
         if self.zmk_scanner is not None and self.scanner_thread is None:
             self._start_zmk_scanner()
 
-        # Start keyboard monitoring
-        self.keyboard_monitor = create_keyboard_monitor()
-        if self.keyboard_monitor:
-            self.keyboard_monitor.connect("key-pressed", self._on_key_pressed)
-            self.keyboard_monitor.connect("key-released", self._on_key_released)
-            logger.info("Global keyboard monitoring started")
-        else:
-            logger.warning("Global keyboard monitoring unavailable")
+        # Start keyboard monitoring (only once, realize can fire again if the window is re-realized,
+        # which would otherwise start a second monitor and deliver every key event twice)
+        if self.keyboard_monitor is None:
+            self.keyboard_monitor = create_keyboard_monitor()
+            if self.keyboard_monitor:
+                self.keyboard_monitor.connect("keys-batched", self._on_keys_batched)
+                logger.info("Global keyboard monitoring started")
+            else:
+                logger.warning("Global keyboard monitoring unavailable")
 
         # Try to set always-on-top after window is realized
         surface = self.get_surface()
@@ -211,167 +323,297 @@ class KeymapWindow(Gtk.ApplicationWindow):
 
     def _render_current_layer(self) -> str:
         """Render SVG for the current layer."""
+        # One drawer serves every layer, so the layout and glyphs are only resolved once
+        if self._drawer is None:
+            self._drawer = create_drawer(self.yaml_data, self.config)
+
         if not self.layer_names:
-            return render_svg(self.yaml_data, self.config)
+            return render_svg(self.yaml_data, self.config, drawer=self._drawer)
 
         layer_name = self.layer_names[self.current_layer_index]
-        return render_svg(self.yaml_data, self.config, layer_name)
+        return render_svg(self.yaml_data, self.config, layer_name, drawer=self._drawer)
 
     def _refresh_layer_display(self) -> None:
         """Refresh the SVG display for the current layer."""
-        self.svg_content = self._render_current_layer()
+        cached = self._layer_cache.get(self.current_layer_index)
+        if cached is None:
+            svg_content = self._render_current_layer()
+
+            # Parse SVG for manipulation
+            cached = (svg_content, ET.fromstring(svg_content.encode("utf-8")))
+            self._layer_cache[self.current_layer_index] = cached
 
-        # Parse SVG for manipulation
-        self.svg_root = ET.fromstring(self.svg_content)
+        # Work on a copy so held/dimmed mutations never touch the cached tree
+        self.svg_content, pristine_root = cached
+        self.svg_root = copy.deepcopy(pristine_root)
+
+        # ElementTree has no parent pointers, so map every child to its parent once per tree
+        if not lxml_available:
+            self._parent_map = {child: parent for parent in self.svg_root.iter() for child in parent}
+        self._build_key_index()
 
         # Apply learned key dimming
         self.learned_keys = self.learning_tracker.get_learned_keys()
         self._apply_dimming_to_tree()
 
         # Update the WebView
-        self._update_webview()
+        self._schedule_webview_update()
 
         if self.layer_names:
             logger.info(f"Showing layer: {self.layer_names[self.current_layer_index]}")
 
+    def _schedule_webview_update(self) -> None:
+        """Reload the WebView once the current burst of events has been handled.
+
+        Multiple requests before the main loop goes idle collapse into a single reload,
+        and reloads are spaced at least UPDATE_MIN_INTERVAL_MS apart.
+        """
+        if self.update_source_id is not None:
+            return
+
+        elapsed_ms = (GLib.get_monotonic_time() - self._last_update_us) // 1000
+        if elapsed_ms < UPDATE_MIN_INTERVAL_MS:
+            self.update_source_id = GLib.timeout_add(UPDATE_MIN_INTERVAL_MS - elapsed_ms, self._on_update_idle)
+        else:
+            self.update_source_id = GLib.idle_add(self._on_update_idle)
+
+    def _on_update_idle(self) -> bool:
+        """Perform a coalesced WebView reload."""
+        self.update_source_id = None
+        self._last_update_us = GLib.get_monotonic_time()
+        self._update_webview()
+        return False  # Don't repeat
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue a task on the worker thread, dropped once the window is closing and the worker shut down."""
+        if not self._closing:
+            self._worker.submit(fn, *args)
+
     def _update_webview(self) -> None:
-        """Update the WebView with the current SVG content."""
+        """Update the WebView with the current SVG content.
+
+        The tree is serialized on the worker thread and loaded back on the main loop.
+        """
         if self.svg_root is None:
             return
 
-        # Convert SVG tree back to string
-        ET.register_namespace("", "http://www.w3.org/2000/svg")
-        ET.register_namespace("xlink", "http://www.w3.org/1999/xlink")
-        svg_string = ET.tostring(self.svg_root, encoding="unicode")
+        self._render_generation += 1
+        layer_index = self.current_layer_index
 
-        # Log for debugging
-        self._log_svg(svg_string)
+        # Nothing structural changed since this layer was last shown, reuse its serialization
+        cached = self._serialized_cache.get(layer_index)
+        if cached is not None and cached[0] is self.learned_keys:
+            self._load_svg(cached[1], cached[2], self._render_generation, layer_index, self.learned_keys)
+            return
 
-        # Create HTML wrapper with transparent background and proper scaling
-        # Use TRANSPARENCY constant for the SVG background opacity
-        bg_opacity = TRANSPARENCY
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        html, body {{
-            margin: 0;
-            padding: 0;
-            background: transparent;
-            overflow: hidden;
-        }}
-        svg {{
-            max-width: 100%;
-            max-height: 100vh;
-            display: block;
-            margin: auto;
-            background-color: rgba(128, 128, 128, {bg_opacity});
-            border-radius: 8px;
-        }}
-        /* Style for held keys */
-        rect.held {{
-            fill: #ffcc00 !important;
-            stroke: #ff9900 !important;
-        }}
-    </style>
-</head>
-<body>
-{svg_string}
-</body>
-</html>"""
+        self._submit(self._serialize_svg, self.svg_root, self._render_generation, layer_index, self.learned_keys)
+
+    def _serialize_svg(
+        self, svg_root: ET.Element, generation: int, layer_index: int, learned_keys: frozenset[str]
+    ) -> None:
+        """Convert the SVG tree to the UTF-8 page WebKit loads (runs on the worker thread).
+
+        Serializing straight to bytes means WebKit gets the page without re-encoding a str.
+        """
+        try:
+            svg_bytes = ET.tostring(svg_root, encoding="utf-8")
+        except Exception as e:
+            logger.error(f"Error serializing SVG: {e}")
+            return
+
+        # Wrap in HTML with transparent background and proper scaling
+        html = GLib.Bytes.new(HTML_HEAD_BYTES + svg_bytes + HTML_TAIL_BYTES)
+        GLib.idle_add(self._load_svg, svg_bytes, html, generation, layer_index, learned_keys)
+
+    def _load_svg(
+        self, svg_bytes: bytes, html: GLib.Bytes, generation: int, layer_index: int, learned_keys: frozenset[str]
+    ) -> bool:
+        """Load a serialized page into the WebView, unless a newer reload has been requested."""
+        self._serialized_cache[layer_index] = (learned_keys, svg_bytes, html)
+        if generation != self._render_generation:
+            return False
+
+        # Log for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_svg(svg_bytes)
 
         # Load the HTML content
         logger.debug("Updating WebView with new SVG content")
-        self.webview.load_html(html, "file:///")
+        self.webview.load_bytes(html, "text/html", "UTF-8", "file:///")
+        return False  # Don't repeat
 
     def _apply_dimming_to_tree(self) -> None:
-        """Apply opacity dimming to learned keys in the SVG tree."""
+        """Apply opacity dimming to learned keys in the SVG tree (queued on the worker thread).
+
+        Only keys whose learned state changed since the last call are touched.
+        """
         if self.svg_root is None:
             return
 
-        dimmed_count = 0
+        to_dim = self.learned_keys - self._dimmed_keys
+        to_undim = self._dimmed_keys - self.learned_keys
+        self._dimmed_keys = self.learned_keys
+        if not to_dim and not to_undim:
+            return
 
-        for group in self.svg_root.iter("{http://www.w3.org/2000/svg}g"):
-            class_attr = group.get("class", "")
+        dim_groups = [group for key in to_dim for group in self._key_group_index.get(key, ())]
+        undim_groups = [group for key in to_undim for group in self._key_group_index.get(key, ())]
+        self._submit(self._set_group_opacity, dim_groups, undim_groups)
+
+    @staticmethod
+    def _set_group_opacity(dim_groups: list[ET.Element], undim_groups: list[ET.Element]) -> None:
+        """Set or clear the learned opacity on key groups (runs on the worker thread)."""
+        opacity = str(LEARNED_KEY_OPACITY)
+        for group in dim_groups:
+            group.set("opacity", opacity)
+        for group in undim_groups:
+            group.attrib.pop("opacity", None)
+
+        if dim_groups or undim_groups:
+            logger.debug(f"Dimmed {len(dim_groups)} and undimmed {len(undim_groups)} keys")
+
+    def _build_key_index(self) -> None:
+        """Index key groups and rects by lowercased label text, once per tree."""
+        self._key_group_index = {}
+        self._key_rect_index = {}
+        self._rect_ids = {}
+        self._rect_classes = {}
+        self._unmapped_keys = set()
+        self._dimmed_keys = frozenset()  # Fresh copies of the pristine tree have nothing dimmed
+        if self.svg_root is None:
+            return
 
-            if "key" not in class_attr:
+        for text_elem in self.svg_root.iter(_SVG_TEXT):
+            class_attr = text_elem.get("class", "")
+            if "key" in class_attr and text_elem.text:
+                # Find parent group's rects
+                parent = text_elem.getparent() if lxml_available else self._parent_map.get(text_elem)  # type: ignore[attr-defined]
+                if parent is not None:
+                    rects = self._key_rect_index.setdefault(text_elem.text.strip().lower(), [])
+                    for rect in parent.findall(_SVG_RECT):
+                        if rect not in rects:
+                            rects.append(rect)
+                        if rect not in self._rect_ids:
+                            # Stable id so the rect can be found in the live DOM
+                            rect_id = rect.get("id") or f"zmk-buddy-rect-{len(self._rect_ids)}"
+                            rect.set("id", rect_id)
+                            self._rect_ids[rect] = rect_id
+
+                            # Precompute both class strings so toggling held is a single attribute set
+                            base_class = " ".join(c for c in rect.get("class", "").split() if c != "held")
+                            self._rect_classes[rect] = (base_class, f"{base_class} held".lstrip())
+
+        # Key groups are dimmed by their tap label
+        for group in self.svg_root.iter(_SVG_G):
+            if "key" not in group.get("class", ""):
                 continue
 
-            for text_elem in group.findall("{http://www.w3.org/2000/svg}text"):
+            for text_elem in group.findall(_SVG_TEXT):
                 text_class = text_elem.get("class", "")
-
                 if "key tap" in text_class or text_class == "key":
-                    key_text = text_elem.text
-                    if key_text:
-                        key_lower = key_text.strip().lower()
-                        if key_lower in self.learned_keys:
-                            group.set("opacity", str(LEARNED_KEY_OPACITY))
-                            dimmed_count += 1
-                        else:
-                            if "opacity" in group.attrib:
-                                del group.attrib["opacity"]
+                    if text_elem.text:
+                        self._key_group_index.setdefault(text_elem.text.strip().lower(), []).append(group)
                         break
 
-        if dimmed_count > 0:
-            logger.debug(f"Applied dimming to {dimmed_count} keys")
-
-    def _update_key_state(self, key_text: str, is_held: bool) -> None:
-        """Update the held state of a key in the SVG."""
+    def _update_key_state(self, key_lower: str, is_held: bool) -> None:
+        """Update the held state of a key (already lowercased) in the SVG."""
         if self.svg_root is None:
             return
 
-        key_text_lower = key_text.lower()
-
-        # Find and update matching key rects
-        for text_elem in self.svg_root.iter("{http://www.w3.org/2000/svg}text"):
-            class_attr = text_elem.get("class", "")
-            if "key" in class_attr:
-                if text_elem.text and text_elem.text.strip().lower() == key_text_lower:
-                    # Find parent group's rect
-                    parent = self._find_parent(self.svg_root, text_elem)
-                    if parent is not None:
-                        for rect in parent.findall("{http://www.w3.org/2000/svg}rect"):
-                            classes = set(rect.get("class", "").split())
-                            if is_held:
-                                classes.add("held")
-                            else:
-                                classes.discard("held")
-                            rect.set("class", " ".join(sorted(classes)))
-
         # Track held keys
         if is_held:
-            self.held_keys.add(key_text)
+            self.held_keys.add(key_lower)
         else:
-            self.held_keys.discard(key_text)
+            self.held_keys.discard(key_lower)
+
+        # Keys with no visual on this layer (media keys, unmapped chars...) have nothing to update
+        rects = self._key_rect_index.get(key_lower)
+        if not rects:
+            if key_lower not in self._unmapped_keys:
+                self._unmapped_keys.add(key_lower)
+                logger.debug(f"Key '{key_lower}' is not shown on this layer")
+            return
 
-        # Update display
-        self._update_webview()
+        # Update matching key rects on the worker, so a later reload serializes the held state
+        self._submit(self._set_rect_classes, [(rect, self._rect_classes[rect][is_held]) for rect in rects])
+
+        # Mirror the change into the live DOM rather than reserializing and reloading the whole page
+        self._set_held_in_dom([self._rect_ids[rect] for rect in rects], is_held)
+
+    @staticmethod
+    def _set_rect_classes(updates: list[tuple[ET.Element, str]]) -> None:
+        """Set the class attribute of key rects (runs on the worker thread)."""
+        for rect, class_str in updates:
+            rect.set("class", class_str)
+
+    def _set_held_in_dom(self, rect_ids: list[str], is_held: bool) -> None:
+        """Toggle the held class on rects in the displayed page.
+
+        Changes are queued and sent in a single script once the main loop goes idle,
+        so a burst of key events costs one JavaScript call.
+        """
+        for rect_id in rect_ids:
+            self._pending_held[rect_id] = is_held
+
+        if self.held_source_id is None:
+            self.held_source_id = GLib.idle_add(self._on_held_idle)
+
+    def _on_held_idle(self) -> bool:
+        """Send the queued held-state changes to the page."""
+        self.held_source_id = None
+        if self._pending_held:
+            changes = json.dumps(self._pending_held)
+            self._pending_held.clear()
+            self._run_javascript(
+                f"for (const [id, held] of Object.entries({changes})) {{"
+                " const e = document.getElementById(id); if (e) e.classList.toggle('held', held); }"
+            )
+        return False  # Don't repeat
+
+    def _run_javascript(self, script: str) -> None:
+        """Run a script in the displayed page, ignoring the result."""
+        self.webview.evaluate_javascript(script, -1, None, None, None, None, None)
 
-    def _find_parent(self, root: ET.Element, child: ET.Element) -> ET.Element | None:
-        """Find the parent of a given element."""
-        for parent in root.iter():
-            if child in list(parent):
-                return parent
-        return None
+    def _on_load_changed(self, webview: WebKit.WebView, load_event: WebKit.LoadEvent) -> None:
+        """Resync held keys once a page load finishes.
 
-    def _log_svg(self, svg_content: str) -> None:
-        """Save SVG to debug directory if logging level is DEBUG."""
-        if not logger.isEnabledFor(logging.DEBUG):
+        The page was serialized from the tree at load time, so any held-state
+        changes made while it was loading would otherwise be lost.
+        """
+        if load_event != WebKit.LoadEvent.FINISHED:
             return
 
-        debug_dir = Path("/tmp/buddy_svg")
-        debug_dir.mkdir(exist_ok=True)
+        held_ids = [self._rect_ids[rect] for key in self.held_keys for rect in self._key_rect_index.get(key, ())]
+        self._run_javascript("document.querySelectorAll('rect.held').forEach(e => e.classList.remove('held'));")
+        if held_ids:
+            self._set_held_in_dom(held_ids, True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        svg_path = debug_dir / f"{timestamp}.svg"
-        svg_path.write_text(svg_content, encoding="utf-8")
-        logger.debug(f"Saved SVG to {svg_path}")
+    def _log_svg(self, svg_content: bytes) -> None:
+        """Save SVG to debug directory, callers check for DEBUG logging first.
 
-        # Clean up old files
-        svg_files = sorted(debug_dir.glob("*.svg"))
-        if len(svg_files) > 4:
-            for old_file in svg_files[:-4]:
-                old_file.unlink()
+        The write happens on a worker thread so the UI never waits on disk I/O.
+        """
+        self._submit(self._write_svg_log, svg_content)
+
+    def _write_svg_log(self, svg_content: bytes) -> None:
+        """Write an SVG snapshot and prune old ones (runs on the worker thread)."""
+        try:
+            SVG_LOG_DIR.mkdir(exist_ok=True)
+
+            # Pick up snapshots from earlier runs once, after that the deque tracks them
+            if self._svg_log_paths is None:
+                self._svg_log_paths = deque(sorted(SVG_LOG_DIR.glob("*.svg")))
+
+            svg_path = SVG_LOG_DIR / f"{_SVG_LOG_RUN}_{next(_svg_log_counter):06d}.svg"
+            svg_path.write_bytes(svg_content)
+            self._svg_log_paths.append(svg_path)
+            logger.debug(f"Saved SVG to {svg_path}")
+
+            # Clean up old files
+            while len(self._svg_log_paths) > SVG_LOG_KEEP:
+                self._svg_log_paths.popleft().unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not save debug SVG: {e}")
 
     def next_layer(self) -> None:
         """Cycle to the next layer."""
@@ -416,40 +658,62 @@ class KeymapWindow(Gtk.ApplicationWindow):
 
         logger.warning(f"Layer '{name}' not found. Available: {self.layer_names}")
 
+    def _on_keys_batched(self, monitor: KeyboardMonitorBase, batch: KeyBatch) -> None:
+        """Handle a batch of global key events in arrival order."""
+        for key_char, is_press in batch:
+            # A key in the batch (testing mode "x") may have closed the window
+            if self._closing:
+                break
+
+            if is_press:
+                self._on_key_pressed(monitor, key_char)
+            else:
+                self._on_key_released(monitor, key_char)
+
     def _on_key_pressed(self, monitor: KeyboardMonitorBase, key_char: str) -> None:
         """Handle global key press."""
+        # Normalize once, the SVG indexes and held/learned sets are all lowercase
+        key_lower = key_char.lower()
+
         # Special keys for testing (only in testing mode)
         if self.testing_mode:
-            if key_char.lower() == "x":
+            if key_lower == "x":
                 logger.info("Exiting...")
                 self.close()
                 return
 
-            if key_char.lower() == "y":
+            if key_lower == "y":
                 self.next_layer()
                 return
 
         # Track for learning
-        self.learning_tracker.on_key_press(key_char)
-        old_learned_keys = self.learned_keys
-        self.learned_keys = self.learning_tracker.get_learned_keys()
+        self.learning_tracker.on_key_press(key_lower)
 
-        # Re-apply dimming if learned keys changed
-        if old_learned_keys != self.learned_keys:
+        # Re-apply dimming if learned keys changed (the tracker hands out a new set only on change)
+        learned_keys = self.learning_tracker.get_learned_keys()
+        if learned_keys is not self.learned_keys:
+            self.learned_keys = learned_keys
             self._apply_dimming_to_tree()
+            self._schedule_webview_update()
 
         # Update display
         logger.debug(f"Key press: {key_char}")
-        self._update_key_state(key_char, is_held=True)
+        self._update_key_state(key_lower, is_held=True)
         self._show_window_temporarily()
 
     def _on_key_released(self, monitor: KeyboardMonitorBase, key_char: str) -> None:
         """Handle global key release."""
-        if key_char.lower() == "y":
+        key_lower = key_char.lower()
+        if key_lower == "y":
+            return
+
+        self.learning_tracker.on_key_release(key_lower)
+
+        # Released before we saw the press (e.g. held at startup), nothing to redraw
+        if key_lower not in self.held_keys:
             return
 
-        self.learning_tracker.on_key_release(key_char)
-        self._update_key_state(key_char, is_held=False)
+        self._update_key_state(key_lower, is_held=False)
 
         if not self.held_keys:
             self._start_hide_timer()
@@ -538,11 +802,20 @@ class KeymapWindow(Gtk.ApplicationWindow):
     def _on_close_request(self, window: Gtk.Window) -> bool:
         """Clean up when window is closed."""
         logger.info("Cleaning up...")
+        self._closing = True
 
         if self.hide_timer_id is not None:
             GLib.source_remove(self.hide_timer_id)
             self.hide_timer_id = None
 
+        if self.update_source_id is not None:
+            GLib.source_remove(self.update_source_id)
+            self.update_source_id = None
+
+        if self.held_source_id is not None:
+            GLib.source_remove(self.held_source_id)
+            self.held_source_id = None
+
         if self.zmk_scanner is not None:
             self._stop_zmk_scanner()
 
@@ -550,6 +823,8 @@ class KeymapWindow(Gtk.ApplicationWindow):
             self.keyboard_monitor.stop()
             self.keyboard_monitor = None
 
+        self._worker.shutdown(wait=False, cancel_futures=True)
+
         try:
             path = self.learning_tracker.save_stats()
             logger.info(f"Saved learning progress: {self.learning_tracker.get_summary()}")
@@ -603,17 +878,25 @@ class KeymapApp(Gtk.Application):
         )
         window.present()
 
+        # Startup objects (config, drawer, layer cache) live for the whole session, move them out of the collector's
+        # way so layer switches don't pay for rescanning them. Only once, activate runs again on every relaunch.
+        if not gc.get_freeze_count():
+            gc.collect()
+            gc.freeze()
 
-def render_svg(yaml_data: dict, config: Config, layer_name: str | None = None) -> str:
-    """Render an SVG from keymap YAML data using KeymapDrawer.
+
+def create_drawer(yaml_data: dict, config: Config) -> KeymapDrawer:
+    """Create a KeymapDrawer for keymap YAML data.
+
+    Construction resolves the physical layout and glyphs, so callers rendering
+    several layers should create one drawer and pass it to render_svg.
 
     Args:
         yaml_data: Parsed YAML keymap data
         config: Configuration object for drawing
-        layer_name: Optional layer name to display (if None, shows all layers)
 
     Returns:
-        SVG content as a string
+        A drawer ready for render_svg
     """
     layout = yaml_data.get("layout", {})
     assert layout, "A layout must be specified in the keymap YAML file"
@@ -621,16 +904,38 @@ def render_svg(yaml_data: dict, config: Config, layer_name: str | None = None) -
     layers = yaml_data.get("layers", {})
     combos = yaml_data.get("combos", [])
 
-    output = StringIO()
-
-    drawer = KeymapDrawer(
+    return KeymapDrawer(
         config=config,
-        out=output,
+        out=StringIO(),
         layers=layers,
         layout=layout,
         combos=combos,
     )
 
+
+def render_svg(
+    yaml_data: dict, config: Config, layer_name: str | None = None, drawer: KeymapDrawer | None = None
+) -> str:
+    """Render an SVG from keymap YAML data using KeymapDrawer.
+
+    Args:
+        yaml_data: Parsed YAML keymap data
+        config: Configuration object for drawing
+        layer_name: Optional layer name to display (if None, shows all layers)
+        drawer: Optional drawer from create_drawer to reuse (must match yaml_data and config)
+
+    Returns:
+        SVG content as a string
+    """
+    if drawer is None:
+        drawer = create_drawer(yaml_data, config)
+
+    # print_board writes to the drawer's output stream and appends to its internal
+    # buffer, so give both fresh streams for each render
+    output = StringIO()
+    drawer.output_stream = output
+    drawer.out = StringIO()
+
     if layer_name:
         drawer.print_board(draw_layers=[layer_name])
     else:
@@ -670,8 +975,7 @@ def live(args: Namespace, config: Config, scanner: "ScannerAPI | None" = None) -
             sys.exit(1)
 
         logger.info(f"Loading custom keymap from: {yaml_path.absolute()}")
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            yaml_data = yaml.safe_load(f)
+        yaml_data = yaml.load(yaml_path.read_bytes(), Loader=YAML_LOADER)
     else:
         from zmk_buddy.data.keymaps import load_default_keymap
 
@@ -6,9 +6,12 @@ which works on Windows, macOS, and Linux (as a fallback when evdev is unavailabl
 """
 
 import logging
-from typing import override
+from functools import lru_cache
+from queue import Empty, SimpleQueue
+from threading import Thread
+from typing import Any, override
 
-from zmk_buddy.keyboard_monitor_base import KeyboardMonitorBase
+from zmk_buddy.keyboard_monitor_base import KeyBatch, KeyboardMonitorBase
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,42 @@ PYNPUT_KEY_MAP: dict[str, str] = {
     "esc": "Esc",
 }
 
+# Every label the map produces, for O(1) membership checks per keystroke
+PYNPUT_LABELS: frozenset[str] = frozenset(PYNPUT_KEY_MAP.values())
+
+
+def _pynput_key_to_char(key) -> str | None:
+    """Convert a pynput key to a character string for SVG lookup"""
+    try:
+        # Check if it's a regular character key
+        char = getattr(key, "char", None)
+        if char:
+            return char
+
+        # The cache hashes the key before calling into it, so unhashable keys fail here
+        return _special_key_to_char(key)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _special_key_to_char(key) -> str | None:
+    """Convert a non-character pynput key to a label.
+
+    pynput reuses its Key members and KeyCodes compare by value, so each key is only translated once.
+    """
+    try:
+        # It's a special key - get its name
+        if hasattr(key, "name"):
+            key_name = key.name.lower()
+            return PYNPUT_KEY_MAP.get(key_name, key_name)
+
+        # Try to get the key value as a string
+        key_str = str(key).replace("Key.", "").lower()
+        return PYNPUT_KEY_MAP.get(key_str, key_str)
+    except Exception:
+        return None
+
 
 class PynputKeyboardMonitor(KeyboardMonitorBase):
     """Monitor keyboard events using pynput (cross-platform).
@@ -60,23 +99,9 @@ class PynputKeyboardMonitor(KeyboardMonitorBase):
         self.stop_flag: bool = False
         self._pynput_listener: "pynput_keyboard.Listener | None" = None
 
-    def _pynput_key_to_char(self, key) -> str | None:
-        """Convert a pynput key to a character string for SVG lookup"""
-        try:
-            # Check if it's a regular character key
-            if hasattr(key, "char") and key.char:
-                return key.char
-
-            # It's a special key - get its name
-            if hasattr(key, "name"):
-                key_name = key.name.lower()
-                return PYNPUT_KEY_MAP.get(key_name, key_name)
-
-            # Try to get the key value as a string
-            key_str = str(key).replace("Key.", "").lower()
-            return PYNPUT_KEY_MAP.get(key_str, key_str)
-        except Exception:
-            return None
+        # Raw (key, pressed) events from the pynput hook, None asks the drain thread to exit
+        self._events: SimpleQueue[tuple[Any, bool] | None] = SimpleQueue()
+        self._drain_thread: Thread | None = None
 
     @override
     def start(self) -> bool:
@@ -84,24 +109,55 @@ class PynputKeyboardMonitor(KeyboardMonitorBase):
         if not pynput_available:
             return False
 
+        # The hook callbacks only queue the raw key: slow hooks stall OS input delivery
+        # and can make pynput drop events, so translation happens on the drain thread
+        put_event = self._events.put_nowait
+
         def on_press(key):
             if self.stop_flag:
                 return False  # Stop listener
-            key_char = self._pynput_key_to_char(key)
-            if key_char and (len(key_char) == 1 or key_char in PYNPUT_KEY_MAP.values()):
-                self.emit_key_pressed(key_char)
+            put_event((key, True))
 
         def on_release(key):
             if self.stop_flag:
                 return False  # Stop listener
-            key_char = self._pynput_key_to_char(key)
-            if key_char and (len(key_char) == 1 or key_char in PYNPUT_KEY_MAP.values()):
-                self.emit_key_released(key_char)
+            put_event((key, False))
+
+        self._drain_thread = Thread(target=self._drain_events, daemon=True)
+        self._drain_thread.start()
 
         self._pynput_listener = pynput_keyboard.Listener(on_press=on_press, on_release=on_release)
         self._pynput_listener.start()
         return True
 
+    def _drain_events(self) -> None:
+        """Translate queued key events and emit them, one batch per wakeup"""
+        get_event = self._events.get
+        get_pending = self._events.get_nowait
+        key_to_char = _pynput_key_to_char
+        batch: KeyBatch = []
+
+        while True:
+            item = get_event()
+            while item is not None:
+                key, pressed = item
+                key_char = key_to_char(key)
+                if key_char and (len(key_char) == 1 or key_char in PYNPUT_LABELS):
+                    batch.append((key_char, pressed))
+
+                # Pick up anything else that arrived meanwhile so it goes out in the same batch
+                try:
+                    item = get_pending()
+                except Empty:
+                    break
+
+            if batch:
+                self.emit_keys_batched(batch)
+                batch.clear()
+
+            if item is None:
+                return
+
     @override
     def stop(self):
         """Stop monitoring keyboard events"""
@@ -110,3 +166,8 @@ class PynputKeyboardMonitor(KeyboardMonitorBase):
         if self._pynput_listener:
             self._pynput_listener.stop()
             self._pynput_listener = None
+
+        if self._drain_thread:
+            self._events.put_nowait(None)
+            self._drain_thread.join(timeout=1.0)
+            self._drain_thread = None
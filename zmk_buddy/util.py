@@ -2,8 +2,12 @@
 
 from pathlib import Path
 
+import yaml
 from platformdirs import user_data_dir
 
+# Prefer libyaml's C loader when available (same safety as safe_load, much faster)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def get_settings_dir() -> Path:
     """Get the platform-specific settings directory for ZMK Buddy.
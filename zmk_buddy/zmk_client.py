@@ -16,10 +16,11 @@ import logging
 import random
 import struct
 import time
-from abc import abstractmethod
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import IntEnum, IntFlag
-from typing import Callable, override
+from functools import lru_cache
+from typing import Callable, NamedTuple, override
 
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
@@ -32,6 +33,11 @@ logger = logging.getLogger(__name__)
 PROSPECTOR_SERVICE_UUID = bytes([0xAB, 0xCD])
 MANUFACTURER_ID = 0xFFFF  # Custom/Local use manufacturer ID
 
+# Layout of the 24-byte payload (see ZMKStatusAdvertisement), compiled once:
+# service UUID (skipped, always PROSPECTOR_SERVICE_UUID), 10 single-byte fields, 3 peripheral batteries,
+# layer name, keyboard ID, modifiers, WPM, channel
+_ADV_STRUCT = struct.Struct("<2xBBBBBBBBBBB4sIBBB")
+
 
 class StatusFlags(IntFlag):
     """Status flags from the ZMK status advertisement (offset 9)."""
@@ -58,6 +64,48 @@ class ModifierFlags(IntFlag):
     RGUI = 1 << 7  # Right GUI
 
 
+# Flag bits as plain ints: testing a raw byte against these never constructs an IntFlag
+_CAPS_WORD = StatusFlags.CAPS_WORD.value
+_CHARGING = StatusFlags.CHARGING.value
+_USB_CONNECTED = StatusFlags.USB_CONNECTED.value
+_USB_HID_READY = StatusFlags.USB_HID_READY.value
+_BLE_CONNECTED = StatusFlags.BLE_CONNECTED.value
+_LCTL = ModifierFlags.LCTL.value
+_LSFT = ModifierFlags.LSFT.value
+_LALT = ModifierFlags.LALT.value
+_LGUI = ModifierFlags.LGUI.value
+_RCTL = ModifierFlags.RCTL.value
+_RSFT = ModifierFlags.RSFT.value
+_RALT = ModifierFlags.RALT.value
+_RGUI = ModifierFlags.RGUI.value
+
+
+# Display name for each modifier bit, in the order active_modifiers lists them
+_MODIFIER_NAMES: tuple[tuple[str, int], ...] = (
+    ("LCtrl", _LCTL),
+    ("RCtrl", _RCTL),
+    ("LShift", _LSFT),
+    ("RShift", _RSFT),
+    ("LAlt", _LALT),
+    ("RAlt", _RALT),
+    ("LGUI", _LGUI),
+    ("RGUI", _RGUI),
+)
+
+
+@lru_cache(maxsize=256)
+def _modifier_names(modifier_flags: int) -> tuple[str, ...]:
+    """Get the names of the modifiers set in a modifier byte (only 256 possible, so all are cached)."""
+    flags = int(modifier_flags)
+    return tuple(name for name, bit in _MODIFIER_NAMES if flags & bit)
+
+
+@lru_cache(maxsize=32)
+def _decode_layer_name(raw: bytes) -> str:
+    """Decode a 4-byte, null-padded layer name (keyboards only have a handful, so they are cached)."""
+    return raw.rstrip(b"\x00").decode("ascii", errors="replace")
+
+
 class DeviceRole(IntEnum):
     """Device role in split keyboard configuration."""
 
@@ -66,11 +114,17 @@ class DeviceRole(IntEnum):
     PERIPHERAL = 2
 
 
-@dataclass
-class ZMKStatusAdvertisement:
+# Valid raw role bytes, so parsing can reject unknown roles without building the enum
+_DEVICE_ROLES: frozenset[int] = frozenset(DeviceRole)
+
+
+class ZMKStatusAdvertisement(NamedTuple):
     """
     Parsed ZMK status advertisement data (24 bytes).
 
+    A NamedTuple rather than a dataclass, since one is built for every advertisement
+    received and the tuple constructor is much cheaper than a generated __init__.
+
     BLE Advertisement Format:
     | Offset | Field | Size | Description |
     |--------|-------|------|-------------|
@@ -100,8 +154,8 @@ class ZMKStatusAdvertisement:
     active_layer: int
     profile_slot: int
     connection_count: int
-    status_flags: StatusFlags
-    device_role: DeviceRole
+    status_flags: int  # StatusFlags bits, kept as the raw byte
+    device_role: int  # DeviceRole value, kept as the raw byte (see role)
     device_index: int
 
     # Peripheral batteries (for split keyboards)
@@ -112,7 +166,7 @@ class ZMKStatusAdvertisement:
     keyboard_id: int
 
     # Input state
-    modifier_flags: ModifierFlags
+    modifier_flags: int  # ModifierFlags bits, kept as the raw byte
     wpm_value: int
     channel: int
 
@@ -141,153 +195,162 @@ class ZMKStatusAdvertisement:
         Returns:
             Parsed ZMKStatusAdvertisement or None if parsing fails
         """
-        if len(data) != 24:
-            logger.debug(f"Invalid payload length: {len(data)} (expected 24)")
+        if len(data) != _ADV_STRUCT.size:
+            logger.debug(f"Invalid payload length: {len(data)} (expected {_ADV_STRUCT.size})")
             return None
 
-        try:
-            # Parse the structure
-            service_uuid = data[0:2]
-
-            # Check service UUID (bytes 0-1 should be 0xAB 0xCD)
-            if service_uuid != PROSPECTOR_SERVICE_UUID:
-                logger.debug(f"Invalid service UUID: {data[0:2].hex()}")
-                return None
-
-            version = data[2]
-            battery_level = data[3]
-            active_layer = data[4]
-            profile_slot = data[5]
-            connection_count = data[6]
-            status_flags = StatusFlags(data[7])
-            device_role = DeviceRole(data[8])
-            device_index = data[9]
-            peripheral_batteries = (data[10], data[11], data[12])
-
-            # Layer name is 4 bytes, null-terminated
-            layer_name_bytes = data[13:17]
-            layer_name = layer_name_bytes.rstrip(b"\x00").decode("ascii", errors="replace")
-
-            # Keyboard ID is a 4-byte hash
-            keyboard_id = struct.unpack("<I", data[17:21])[0]
-
-            modifier_flags = ModifierFlags(data[21])
-            wpm_value = data[22]
-            channel = data[23]
-
-            return cls(
-                service_uuid=service_uuid,
-                version=version,
-                battery_level=battery_level,
-                active_layer=active_layer,
-                profile_slot=profile_slot,
-                connection_count=connection_count,
-                status_flags=status_flags,
-                device_role=device_role,
-                device_index=device_index,
-                peripheral_batteries=peripheral_batteries,
-                layer_name=layer_name,
-                keyboard_id=keyboard_id,
-                modifier_flags=modifier_flags,
-                wpm_value=wpm_value,
-                channel=channel,
-                rssi=rssi,
-                device_address=device_address,
-                device_name=device_name,
-            )
-        except (struct.error, ValueError) as e:
-            logger.debug(f"Failed to parse advertisement: {e}")
+        # Check service UUID (bytes 0-1 should be 0xAB 0xCD)
+        if not data.startswith(PROSPECTOR_SERVICE_UUID):
+            logger.debug(f"Invalid service UUID: {data[0:2].hex()}")
             return None
 
+        return _parse_adv(data, rssi, device_address, device_name)
+
+    @property
+    def role(self) -> DeviceRole:
+        """Get the device role in the split keyboard configuration."""
+        return DeviceRole(self.device_role)
+
     @property
     def is_usb_connected(self) -> bool:
         """Check if the keyboard is connected via USB."""
-        return bool(self.status_flags & StatusFlags.USB_CONNECTED)
+        return bool(self.status_flags & _USB_CONNECTED)
 
     @property
     def is_usb_hid_ready(self) -> bool:
         """Check if USB HID is ready."""
-        return bool(self.status_flags & StatusFlags.USB_HID_READY)
+        return bool(self.status_flags & _USB_HID_READY)
 
     @property
     def is_ble_connected(self) -> bool:
         """Check if the keyboard is connected via BLE."""
-        return bool(self.status_flags & StatusFlags.BLE_CONNECTED)
+        return bool(self.status_flags & _BLE_CONNECTED)
 
     @property
     def is_charging(self) -> bool:
         """Check if the keyboard is charging."""
-        return bool(self.status_flags & StatusFlags.CHARGING)
+        return bool(self.status_flags & _CHARGING)
 
     @property
     def is_caps_word(self) -> bool:
         """Check if caps word mode is active."""
-        return bool(self.status_flags & StatusFlags.CAPS_WORD)
+        return bool(self.status_flags & _CAPS_WORD)
 
     @property
     def has_left_ctrl(self) -> bool:
         """Check if left control is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.LCTL)
+        return bool(self.modifier_flags & _LCTL)
 
     @property
     def has_left_shift(self) -> bool:
         """Check if left shift is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.LSFT)
+        return bool(self.modifier_flags & _LSFT)
 
     @property
     def has_left_alt(self) -> bool:
         """Check if left alt is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.LALT)
+        return bool(self.modifier_flags & _LALT)
 
     @property
     def has_left_gui(self) -> bool:
         """Check if left GUI (Win/Cmd) is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.LGUI)
+        return bool(self.modifier_flags & _LGUI)
 
     @property
     def has_right_ctrl(self) -> bool:
         """Check if right control is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.RCTL)
+        return bool(self.modifier_flags & _RCTL)
 
     @property
     def has_right_shift(self) -> bool:
         """Check if right shift is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.RSFT)
+        return bool(self.modifier_flags & _RSFT)
 
     @property
     def has_right_alt(self) -> bool:
         """Check if right alt is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.RALT)
+        return bool(self.modifier_flags & _RALT)
 
     @property
     def has_right_gui(self) -> bool:
         """Check if right GUI (Win/Cmd) is pressed."""
-        return bool(self.modifier_flags & ModifierFlags.RGUI)
+        return bool(self.modifier_flags & _RGUI)
 
     @property
     def active_modifiers(self) -> list[str]:
         """Get list of currently active modifier names."""
-        modifiers = []
-        if self.has_left_ctrl:
-            modifiers.append("LCtrl")
-        if self.has_right_ctrl:
-            modifiers.append("RCtrl")
-        if self.has_left_shift:
-            modifiers.append("LShift")
-        if self.has_right_shift:
-            modifiers.append("RShift")
-        if self.has_left_alt:
-            modifiers.append("LAlt")
-        if self.has_right_alt:
-            modifiers.append("RAlt")
-        if self.has_left_gui:
-            modifiers.append("LGUI")
-        if self.has_right_gui:
-            modifiers.append("RGUI")
-        return modifiers
-
-
-@dataclass
+        return list(_modifier_names(self.modifier_flags))
+
+
+def _parse_adv(
+    data: bytes,
+    rssi: int,
+    device_address: str,
+    device_name: str,
+    _unpack=_ADV_STRUCT.unpack_from,
+    _decode_layer=_decode_layer_name,
+    _roles=_DEVICE_ROLES,
+    _cls=ZMKStatusAdvertisement,
+    _service_uuid=PROSPECTOR_SERVICE_UUID,
+    _debug=logger.debug,
+) -> ZMKStatusAdvertisement | None:
+    """Parse a status advertisement payload, see ZMKStatusAdvertisement.from_manufacturer_data.
+
+    The caller must already have checked the payload length and service UUID.
+    This runs for every matching BLE advertisement, so the globals it needs are
+    bound as default arguments (fast local lookups) rather than looked up per call.
+    """
+    # Unpack every field in one call
+    (
+        version,
+        battery_level,
+        active_layer,
+        profile_slot,
+        connection_count,
+        status_flags_raw,
+        device_role_raw,
+        device_index,
+        left_battery,
+        right_battery,
+        aux_battery,
+        layer_name_bytes,
+        keyboard_id,
+        modifier_flags_raw,
+        wpm_value,
+        channel,
+    ) = _unpack(data)
+
+    if device_role_raw not in _roles:
+        _debug(f"Failed to parse advertisement: {device_role_raw} is not a valid DeviceRole")
+        return None
+
+    # Layer name is 4 bytes, null-terminated
+    layer_name = _decode_layer(layer_name_bytes)
+
+    return _cls(
+        # Already checked to match, so share the constant rather than copying it out of the payload
+        service_uuid=_service_uuid,
+        version=version,
+        battery_level=battery_level,
+        active_layer=active_layer,
+        profile_slot=profile_slot,
+        connection_count=connection_count,
+        status_flags=status_flags_raw,
+        device_role=device_role_raw,
+        device_index=device_index,
+        peripheral_batteries=(left_battery, right_battery, aux_battery),
+        layer_name=layer_name,
+        keyboard_id=keyboard_id,
+        modifier_flags=modifier_flags_raw,
+        wpm_value=wpm_value,
+        channel=channel,
+        rssi=rssi,
+        device_address=device_address,
+        device_name=device_name,
+    )
+
+
+@dataclass(slots=True)
 class ZMKDevice:
     """Represents a discovered ZMK keyboard device."""
 
@@ -296,14 +359,14 @@ class ZMKDevice:
     keyboard_id: int
     last_advertisement: ZMKStatusAdvertisement | None = None
     last_seen: float = 0.0  # Unix timestamp
+    last_payload: bytes = b""  # Raw manufacturer data behind last_advertisement
 
 
 # Type alias for the callback
 StatusCallback = Callable[[ZMKStatusAdvertisement], None]
 
 
-@dataclass
-class ScannerAPI:
+class ScannerAPI(ABC):
     """
     Abstract base class for ZMK keyboard scanners.
 
@@ -311,19 +374,23 @@ class ScannerAPI:
     from ZMK keyboards. Implementations can use BLE, simulation, or other methods.
     """
 
-    _callbacks: list[StatusCallback] = field(default_factory=list, init=False)
-    _devices: dict[str, ZMKDevice] = field(default_factory=dict, init=False)
-    _running: bool = field(default=False, init=False)
+    __slots__ = ("_callbacks", "_devices", "_running")
+
+    def __init__(self) -> None:
+        # Replaced rather than mutated, so notify loops can iterate it while callbacks are added or removed
+        self._callbacks: tuple[StatusCallback, ...] = ()
+        self._devices: dict[str, ZMKDevice] = {}
+        self._running = False
 
     def add_callback(self, callback: StatusCallback) -> None:
         """Register a callback to receive status updates."""
         if callback not in self._callbacks:
-            self._callbacks.append(callback)
+            self._callbacks = (*self._callbacks, callback)
 
     def remove_callback(self, callback: StatusCallback) -> None:
         """Unregister a status callback."""
         if callback in self._callbacks:
-            self._callbacks.remove(callback)
+            self._callbacks = tuple(cb for cb in self._callbacks if cb != callback)
 
     @abstractmethod
     async def start(self) -> None:
@@ -348,6 +415,14 @@ class ScannerAPI:
         """Check if the scanner is currently running."""
         return self._running
 
+    def _notify_callbacks(self, status: ZMKStatusAdvertisement) -> None:
+        """Pass a status update to every registered callback."""
+        for callback in self._callbacks:
+            try:
+                callback(status)
+            except Exception as e:
+                logger.error(f"Error in status callback: {e}")
+
     def get_devices(self) -> list[ZMKDevice]:
         """Get list of all discovered ZMK devices."""
         return list(self._devices.values())
@@ -361,7 +436,6 @@ class ScannerAPI:
         self._devices.clear()
 
 
-@dataclass
 class ZMKScanner(ScannerAPI):
     """
     BLE scanner for ZMK keyboards with Prospector status advertisement.
@@ -380,48 +454,79 @@ class ZMKScanner(ScannerAPI):
         await scanner.stop()
     """
 
-    _scanner: BleakScanner | None = field(default=None, init=False, repr=False)
-    _scan_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
-
-    def _detection_callback(self, device: BLEDevice, advertisement_data: AdvertisementData) -> None:
-        """Internal callback for BLE advertisement detection."""
+    __slots__ = ("_scanner", "_scan_task", "_loop")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._scanner: BleakScanner | None = None
+        self._scan_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _detection_callback(
+        self,
+        device: BLEDevice,
+        advertisement_data: AdvertisementData,
+        _ZMKDevice=ZMKDevice,
+        _parse=_parse_adv,
+        _time=time.time,
+        _MFR=MANUFACTURER_ID,
+        _size=_ADV_STRUCT.size,
+        _prefix=PROSPECTOR_SERVICE_UUID,
+        _info=logger.info,
+    ) -> None:
+        """Internal callback for BLE advertisement detection.
+
+        Called for every advertisement the scanner hears, so the globals it needs
+        are bound as default arguments like _parse_adv does.
+        """
         # Check for manufacturer data with our manufacturer ID
-        manufacturer_data = advertisement_data.manufacturer_data.get(MANUFACTURER_ID)
+        manufacturer_data = advertisement_data.manufacturer_data.get(_MFR)
         if manufacturer_data is None:
             return
 
+        # Cheaply reject anything that isn't a Prospector payload before parsing
+        # (startswith compares in place, without slicing out the prefix)
+        if len(manufacturer_data) != _size or not manufacturer_data.startswith(_prefix):
+            return
+
+        now = _time()
+        address = device.address
+        zmk_device = self._devices.get(address)
+
+        # Keyboards repeat the same payload until their state changes, only the first copy needs parsing
+        if zmk_device is not None and zmk_device.last_payload == manufacturer_data:
+            zmk_device.last_seen = now
+            return
+
         # Try to parse the advertisement
-        status = ZMKStatusAdvertisement.from_manufacturer_data(
-            data=manufacturer_data,
-            rssi=advertisement_data.rssi if advertisement_data.rssi else 0,
-            device_address=device.address,
-            device_name=advertisement_data.local_name or device.name or "",
+        status = _parse(
+            manufacturer_data,
+            advertisement_data.rssi if advertisement_data.rssi else 0,
+            address,
+            advertisement_data.local_name or device.name or "",
         )
 
         if status is None:
             return
 
         # Update or create device entry
-        now = time.time()
-
-        if device.address not in self._devices:
-            self._devices[device.address] = ZMKDevice(
-                address=device.address,
+        if zmk_device is None:
+            zmk_device = self._devices[address] = _ZMKDevice(
+                address=address,
                 name=status.device_name,
                 keyboard_id=status.keyboard_id,
             )
-            logger.info(f"Discovered new ZMK device: {status.device_name} ({device.address})")
+            _info(f"Discovered new ZMK device: {status.device_name} ({address})")
 
-        zmk_device = self._devices[device.address]
         zmk_device.last_advertisement = status
+        zmk_device.last_payload = manufacturer_data
         zmk_device.last_seen = now
 
-        # Notify callbacks
-        for callback in self._callbacks:
-            try:
-                callback(status)
-            except Exception as e:
-                logger.error(f"Error in status callback: {e}")
+        # Notify callbacks from a fresh loop iteration, so slow callbacks don't hold up BLE reception
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._notify_callbacks, status)
+        else:
+            self._notify_callbacks(status)
 
     @override
     async def start(self) -> None:
@@ -439,6 +544,9 @@ class ZMKScanner(ScannerAPI):
         logger.info("Starting ZMK BLE scanner...")
         self._running = True
 
+        # Bleak delivers detections on this loop, callbacks are fanned out from it
+        self._loop = asyncio.get_running_loop()
+
         # Create scanner with detection callback
         self._scanner = BleakScanner(detection_callback=self._detection_callback)
 
@@ -476,7 +584,19 @@ class ZMKScanner(ScannerAPI):
         logger.info("ZMK BLE scanner stopped")
 
 
-@dataclass
+# Modifier combinations the simulated keyboard picks from, built once at import
+_SIM_MODIFIER_OPTIONS: tuple[ModifierFlags, ...] = (
+    ModifierFlags(0),  # No modifiers
+    ModifierFlags.LSFT,  # Left Shift
+    ModifierFlags.LCTL,  # Left Control
+    ModifierFlags.LALT,  # Left Alt
+    ModifierFlags.LGUI,  # Left GUI
+    ModifierFlags.LSFT | ModifierFlags.LCTL,  # Shift + Ctrl
+    ModifierFlags.LCTL | ModifierFlags.LALT,  # Ctrl + Alt
+    ModifierFlags.RSFT,  # Right Shift
+)
+
+
 class SimScanner(ScannerAPI):
     """
     Simulated scanner for testing purposes.
@@ -486,25 +606,39 @@ class SimScanner(ScannerAPI):
     """
 
     # Simulated device address
-    SIM_DEVICE_ADDRESS: str = field(default="SIM:00:00:00:00:01", init=False)
-    SIM_DEVICE_NAME: str = field(default="Simulated ZMK Keyboard", init=False)
+    SIM_DEVICE_ADDRESS = "SIM:00:00:00:00:01"
+    SIM_DEVICE_NAME = "Simulated ZMK Keyboard"
 
-    # Update interval in seconds
-    _update_interval: float = 3.0
+    # Layer names to cycle through
+    LAYER_NAMES: tuple[str, ...] = ("Base", "Nav", "Num", "Combos", "Fn")
+
+    __slots__ = (
+        "_update_interval",
+        "_update_task",
+        "_current_layer_index",
+        "_current_battery",
+        "_current_modifiers",
+        "_rng",
+    )
 
-    # Internal state
-    _update_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+    def __init__(self, update_interval: float = 3.0) -> None:
+        """
+        Args:
+            update_interval: Seconds between simulated status updates
+        """
+        super().__init__()
+        self._update_interval = update_interval
 
-    # Simulation state
-    _current_layer_index: int = field(default=0, init=False)
-    _current_battery: int = field(default=85, init=False)
-    _current_modifiers: ModifierFlags = field(default=ModifierFlags(0), init=False)
+        # Internal state
+        self._update_task: asyncio.Task[None] | None = None
 
-    # Layer names to cycle through
-    LAYER_NAMES: list[str] = field(
-        default_factory=lambda: ["Base", "Nav", "Num", "Combos", "Fn"],
-        init=False,
-    )
+        # Simulation state
+        self._current_layer_index = 0
+        self._current_battery = 85
+        self._current_modifiers = ModifierFlags(0)
+
+        # Private generator, avoids the shared module-level instance on every tick
+        self._rng = random.Random()
 
     @override
     async def start(self) -> None:
@@ -569,11 +703,7 @@ class SimScanner(ScannerAPI):
                     device.last_seen = time.time()
 
                 # Notify callbacks
-                for callback in self._callbacks:
-                    try:
-                        callback(status)
-                    except Exception as e:
-                        logger.error(f"Error in status callback: {e}")
+                self._notify_callbacks(status)
 
             except asyncio.CancelledError:
                 break
@@ -586,21 +716,11 @@ class SimScanner(ScannerAPI):
         self._current_layer_index = (self._current_layer_index + 1) % len(self.LAYER_NAMES)
 
         # Randomly adjust battery (slowly drain or charge)
-        battery_change = random.randint(-2, 1)
+        battery_change = self._rng.randint(-2, 1)
         self._current_battery = max(10, min(100, self._current_battery + battery_change))
 
         # Randomly toggle modifiers
-        modifier_options = [
-            ModifierFlags(0),  # No modifiers
-            ModifierFlags.LSFT,  # Left Shift
-            ModifierFlags.LCTL,  # Left Control
-            ModifierFlags.LALT,  # Left Alt
-            ModifierFlags.LGUI,  # Left GUI
-            ModifierFlags.LSFT | ModifierFlags.LCTL,  # Shift + Ctrl
-            ModifierFlags.LCTL | ModifierFlags.LALT,  # Ctrl + Alt
-            ModifierFlags.RSFT,  # Right Shift
-        ]
-        self._current_modifiers = random.choice(modifier_options)
+        self._current_modifiers = self._rng.choice(_SIM_MODIFIER_OPTIONS)
 
     def _create_status(self) -> ZMKStatusAdvertisement:
         """Create a simulated status advertisement with current state."""
@@ -620,7 +740,7 @@ class SimScanner(ScannerAPI):
             layer_name=layer_name[:4],  # Truncate to 4 chars like real protocol
             keyboard_id=0x12345678,
             modifier_flags=self._current_modifiers,
-            wpm_value=random.randint(0, 80),
+            wpm_value=self._rng.randint(0, 80),
             channel=0,
             rssi=-50,
             device_address=self.SIM_DEVICE_ADDRESS,